@@ -5,20 +5,134 @@ Mapped to /api/use-cases by filename convention.
 Reads SMARTSHEET_API_TOKEN from Vercel Environment Variables.
 """
 
+import io
 import json
 import os
+import threading
+import time
 import urllib.request
 import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler
 from pathlib import Path
 from typing import Any
 
+# Prefer a C-accelerated JSON library when available (orjson, then ujson);
+# fall back to the stdlib so the function still works without either.
+try:
+    import orjson as _json_fast  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import ujson as _json_fast  # type: ignore[import-not-found, no-redef]
+    except ImportError:
+        _json_fast = json  # type: ignore[assignment]
+
+# A module-level connection pool keeps the TLS session to api.smartsheet.com
+# alive across warm invocations; fall back to one-shot urllib otherwise.
+try:
+    import urllib3  # type: ignore[import-not-found]
+
+    _HTTP: Any = urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        timeout=urllib3.Timeout(connect=5.0, read=15.0),
+    )
+except ImportError:
+    _HTTP = None
+
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "data" / "smartsheet_config.json"
 
+# Shared default for .get() in the parse path — a literal [] default would
+# allocate a fresh list per call even when the key is present.
+_EMPTY: tuple = ()
+
+
+# Compact encoder for the stdlib fallback path
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize *payload* to compact JSON bytes with the fastest available encoder."""
+    if _json_fast is not json:
+        # orjson returns bytes directly — no intermediate str
+        out = _json_fast.dumps(payload)
+        return out if isinstance(out, bytes) else out.encode("utf-8")
+    # Stdlib fallback: stream encoder chunks into a bytes buffer instead of
+    # materializing the whole document as one str and copying it to bytes.
+    buf = io.BytesIO()
+    write = buf.write
+    for chunk in _ENCODER.iterencode(payload):
+        write(chunk.encode("utf-8"))
+    return buf.getvalue()
+
 
 def _load_config() -> dict[str, Any]:
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # json.loads accepts bytes — no text-mode decode pass
+    return json.loads(CONFIG_PATH.read_bytes())
+
+
+# The config never changes within a deploy — parse it once at import so
+# every warm invocation skips the file read and the derived-dict rebuild.
+_CONFIG = _load_config()
+_SHEET_ID = _CONFIG["sheet_id"]
+_COL_MAP = _CONFIG["column_map"]
+_TITLE_TO_FIELD: dict[str, str] = {v: k for k, v in _COL_MAP.items()}
+
+# When the config lists the numeric column_ids for the mapped columns,
+# ask Smartsheet for just those columns — less JSON to move and parse.
+_SHEET_URL = f"https://api.smartsheet.com/2.0/sheets/{_SHEET_ID}"
+if _CONFIG.get("column_ids"):
+    _SHEET_URL += "?columnIds=" + ",".join(str(cid) for cid in _CONFIG["column_ids"])
+
+# Constant pieces of every response, built once instead of per request
+_METADATA_BASE = {"source": "Smartsheet (live)", "last_updated": "live"}
+_RESPONSE_HEADERS = (
+    ("Content-Type", "application/json"),
+    ("Cache-Control", "s-maxage=60, stale-while-revalidate=300"),
+)
+
+
+def _row_to_record(idx: int, row: dict[str, Any], col_get: Any) -> dict[str, Any]:
+    """Turn one Smartsheet row into a use_case record (may lack a name)."""
+    record: dict[str, Any] = {"id": idx}
+    for cell in row.get("cells", _EMPTY):
+        field = col_get(cell.get("columnId"))
+        if field is not None:
+            record[field] = cell.get("displayValue") or cell.get("value") or ""
+    return record
+
+
+# Below this row count the thread-pool setup costs more than it saves
+_PARALLEL_ROW_THRESHOLD = 500
+
+
+def _parse_rows(rows: Any, col_id_to_field: dict[int, str]) -> list[dict[str, Any]]:
+    """Parse rows into named use_case records, fanning out on large sheets.
+
+    Rows without a name are dropped but keep their slot in the id numbering,
+    so ids are identical whether or not the parallel path runs.
+    """
+    col_get = col_id_to_field.get
+
+    def parse_slice(start: int, chunk: Any) -> list[dict[str, Any]]:
+        # The comprehension collects accepted records via the dedicated
+        # LIST_APPEND opcode, skipping bound-method dispatch per row.
+        return [
+            record
+            for idx, row in enumerate(chunk, start=start + 1)
+            if (record := _row_to_record(idx, row, col_get)).get("name")
+        ]
+
+    if len(rows) < _PARALLEL_ROW_THRESHOLD:
+        return parse_slice(0, rows)
+
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(rows) // workers)  # ceil division
+    starts = range(0, len(rows), chunk_size)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(parse_slice, starts, (rows[s:s + chunk_size] for s in starts))
+    return [record for sub in results for record in sub]
 
 
 def _fetch_smartsheet_data() -> dict[str, Any]:
@@ -27,70 +141,77 @@ def _fetch_smartsheet_data() -> dict[str, Any]:
     if not token:
         raise RuntimeError("SMARTSHEET_API_TOKEN is not configured.")
 
-    config = _load_config()
-    sheet_id = config["sheet_id"]
-    col_map = config["column_map"]
-
-    url = f"https://api.smartsheet.com/2.0/sheets/{sheet_id}"
-    req = urllib.request.Request(
-        url,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        sheet = json.loads(resp.read().decode("utf-8"))
-
-    # Build column-id → column-title lookup
-    col_id_to_title: dict[int, str] = {
-        col["id"]: col["title"] for col in sheet.get("columns", [])
+    url = _SHEET_URL
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+    }
+    if _HTTP is not None:
+        resp = _HTTP.request("GET", url, headers=headers)
+        if resp.status >= 400:
+            # Match the urllib path so do_GET's 502 mapping still applies
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, None, None)
+        raw = resp.data
+    else:
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=15) as fallback_resp:
+            raw = fallback_resp.read()
+    # orjson/ujson parse bytes directly — skip the .decode() pass
+    sheet = _json_fast.loads(raw)
+
+    # Build column-id → json_field lookup (one dict hop per cell instead of two)
+    col_id_to_field: dict[int, str] = {
+        col["id"]: _TITLE_TO_FIELD[col["title"]]
+        for col in sheet.get("columns", _EMPTY)
+        if col["title"] in _TITLE_TO_FIELD
     }
 
-    # Build title → json_field reverse lookup
-    title_to_field: dict[str, str] = {v: k for k, v in col_map.items()}
-
-    # Parse rows into use_case dicts
-    use_cases: list[dict[str, Any]] = []
-    for idx, row in enumerate(sheet.get("rows", []), start=1):
-        record: dict[str, Any] = {"id": idx}
-        for cell in row.get("cells", []):
-            col_title = col_id_to_title.get(cell.get("columnId", 0), "")
-            field = title_to_field.get(col_title)
-            if field:
-                record[field] = cell.get("displayValue") or cell.get("value") or ""
-        if record.get("name"):
-            use_cases.append(record)
-
-    statuses = [uc.get("status", "") for uc in use_cases]
+    use_cases = _parse_rows(sheet.get("rows", _EMPTY), col_id_to_field)
+    status_counts = Counter(uc.get("status", "") for uc in use_cases)
+
     summary = {
         "total_initiatives": len(use_cases),
-        "in_production": statuses.count("In Production"),
-        "poc_done": statuses.count("POC Done"),
-        "poc_in_progress": statuses.count("POC In Progress"),
+        "in_production": status_counts["In Production"],
+        "poc_done": status_counts["POC Done"],
+        "poc_in_progress": status_counts["POC In Progress"],
     }
 
     return {
-        "metadata": {
-            "title": sheet.get("name", "AI Use Cases"),
-            "source": "Smartsheet (live)",
-            "last_updated": "live",
-        },
+        "metadata": {"title": sheet.get("name", "AI Use Cases"), **_METADATA_BASE},
         "summary": summary,
         "use_cases": use_cases,
     }
 
 
+# Short in-process cache of the encoded body: rapid repeat hits on a warm
+# container skip the Smartsheet fetch, the row parsing, and the encode.
+# TTL mirrors the s-maxage already set on the edge cache.
+_CACHE_TTL = 60.0
+_cache_lock = threading.Lock()
+_cached_body: "tuple[float, bytes] | None" = None
+
+
+def _get_body() -> bytes:
+    """Return the encoded /api/use-cases body, refreshing it when stale."""
+    global _cached_body
+    with _cache_lock:
+        if _cached_body is not None and time.monotonic() - _cached_body[0] < _CACHE_TTL:
+            return _cached_body[1]
+        # Fetch while holding the lock so concurrent callers don't stampede
+        body = _dumps(_fetch_smartsheet_data())
+        _cached_body = (time.monotonic(), body)
+        return body
+
+
 class handler(BaseHTTPRequestHandler):
     """Vercel serverless handler for GET /api/use-cases."""
 
     def do_GET(self) -> None:
         try:
-            payload = _fetch_smartsheet_data()
-            body = json.dumps(payload, indent=2).encode("utf-8")
+            body = _get_body()
             self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Cache-Control", "s-maxage=60, stale-while-revalidate=300")
+            for name, value in _RESPONSE_HEADERS:
+                self.send_header(name, value)
             self.end_headers()
             self.wfile.write(body)
         except RuntimeError as exc:
@@ -101,7 +222,7 @@ class handler(BaseHTTPRequestHandler):
             self._send_error(500, f"Internal error: {exc}")
 
     def _send_error(self, code: int, message: str) -> None:
-        body = json.dumps({"error": message}).encode("utf-8")
+        body = _dumps({"error": message})
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
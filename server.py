@@ -16,124 +16,303 @@ Usage:
 Then open http://localhost:8080
 """
 
+import io
 import json
 import os
+import re
+import threading
+import time
 import urllib.request
 import urllib.error
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 
+# Prefer a C-accelerated JSON library when available (orjson, then ujson);
+# fall back to the stdlib so the server still works without either.
+try:
+    import orjson as _json_fast  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import ujson as _json_fast  # type: ignore[import-not-found, no-redef]
+    except ImportError:
+        _json_fast = json  # type: ignore[assignment]
+
+# A module-level connection pool keeps the TLS session to api.smartsheet.com
+# alive between requests; fall back to one-shot urllib otherwise.
+try:
+    import urllib3  # type: ignore[import-not-found]
+
+    _HTTP: Any = urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        timeout=urllib3.Timeout(connect=5.0, read=15.0),
+    )
+except ImportError:
+    _HTTP = None
+
+# Compiled row parser (see _parser.pyx) — used when someone has run
+# `cythonize -i _parser.pyx`; the pure-Python loop remains the fallback.
+try:
+    from _parser import parse_rows as _parse_rows_c  # type: ignore[import-not-found]
+except ImportError:
+    _parse_rows_c = None
+
+# With aiohttp installed the server runs on an event loop: the Smartsheet
+# round-trip no longer blocks static-file requests from other clients.
+try:
+    import aiohttp  # type: ignore[import-not-found]
+    from aiohttp import web  # type: ignore[import-not-found]
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
 PORT = 8080
+
+# Shared default for .get() in the parse path — a literal [] default would
+# allocate a fresh list per call even when the key is present.
+_EMPTY: tuple = ()
+
 ENV_PATH = Path(__file__).parent / ".env"
 CONFIG_PATH = Path(__file__).parent / "data" / "smartsheet_config.json"
 
 
+# Matches one KEY=VALUE line; blank lines and #-comments simply don't match.
+# Whitespace atoms are [^\S\n] (not \s) so an empty value can't make the
+# match swallow the newline and the following line.
+_ENV_RE = re.compile(
+    r"^[^\S\n]*(?:export[^\S\n]+)?([A-Za-z_][A-Za-z0-9_]*)"
+    r"[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$",
+    re.M,
+)
+
+
 def load_dotenv(path: Path = ENV_PATH) -> None:
     """Read a .env file and inject KEY=VALUE pairs into os.environ.
 
     - Skips blank lines and comments (lines starting with #).
     - Strips optional 'export ' prefix so the same file works with `source`.
     - Does NOT override variables that are already set in the environment.
+    - Bare `KEY` lines without an `=` are skipped (the old per-line loop
+      set them to an empty string).
+
+    One precompiled regex pass over the file replaces the old per-line
+    strip/startswith/partition loop.
     """
     if not path.is_file():
         return
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            # Allow optional 'export ' prefix
-            if line.startswith("export "):
-                line = line[len("export "):]
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if key and key not in os.environ:
-                os.environ[key] = value
+    for match in _ENV_RE.finditer(path.read_text(encoding="utf-8")):
+        key, value = match.group(1, 2)
+        if key not in os.environ:
+            os.environ[key] = value
+
+
+# Compact encoder for the stdlib fallback path
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize *payload* to compact JSON bytes with the fastest available encoder."""
+    if _json_fast is not json:
+        # orjson returns bytes directly — no intermediate str
+        out = _json_fast.dumps(payload)
+        return out if isinstance(out, bytes) else out.encode("utf-8")
+    # Stdlib fallback: stream encoder chunks into a bytes buffer instead of
+    # materializing the whole document as one str and copying it to bytes.
+    buf = io.BytesIO()
+    write = buf.write
+    for chunk in _ENCODER.iterencode(payload):
+        write(chunk.encode("utf-8"))
+    return buf.getvalue()
 
 
 def load_smartsheet_config() -> dict[str, Any]:
     """Load Smartsheet settings from the config file."""
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # json.loads accepts bytes — no text-mode decode pass
+    return json.loads(CONFIG_PATH.read_bytes())
 
 
-def fetch_smartsheet_data() -> dict[str, Any]:
-    """
-    Call the Smartsheet API and return data in the same shape as use_cases.json.
+# The config never changes while the server runs — parse it once at import
+# so each /api/use-cases request skips the file read and derived-dict rebuild.
+_CONFIG = load_smartsheet_config()
+_SHEET_ID = _CONFIG["sheet_id"]
+_COL_MAP = _CONFIG["column_map"]
+_TITLE_TO_FIELD: dict[str, str] = {v: k for k, v in _COL_MAP.items()}
 
-    Requires SMARTSHEET_API_TOKEN env var and a valid sheet_id in
-    data/smartsheet_config.json.
-    """
+# When the config lists the numeric column_ids for the mapped columns,
+# ask Smartsheet for just those columns — less JSON to move and parse.
+_SHEET_URL = f"https://api.smartsheet.com/2.0/sheets/{_SHEET_ID}"
+if _CONFIG.get("column_ids"):
+    _SHEET_URL += "?columnIds=" + ",".join(str(cid) for cid in _CONFIG["column_ids"])
+
+# Constant pieces of every response, built once instead of per request
+_METADATA_BASE = {"source": "Smartsheet (live)", "last_updated": "live"}
+
+
+def _require_token() -> str:
+    """Return the Smartsheet API token or raise if it is not configured."""
     token = os.environ.get("SMARTSHEET_API_TOKEN", "").strip()
     if not token:
         raise RuntimeError(
             "SMARTSHEET_API_TOKEN environment variable is not set. "
             "Export it before starting the server for Smartsheet mode."
         )
+    return token
 
-    config = load_smartsheet_config()
-    sheet_id = config["sheet_id"]
-    col_map = config["column_map"]
-
-    # Fetch the full sheet (columns + rows in one call)
-    url = f"https://api.smartsheet.com/2.0/sheets/{sheet_id}"
-    req = urllib.request.Request(
-        url,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        sheet = json.loads(resp.read().decode("utf-8"))
-
-    # Build column-id → column-title lookup
-    col_id_to_title: dict[int, str] = {}
-    for col in sheet.get("columns", []):
-        col_id_to_title[col["id"]] = col["title"]
-
-    # Invert col_map: json_field → sheet_column_title
-    # e.g. {"name": "Use Case", ...}
-    field_to_title = col_map
-
-    # Build title → json_field reverse lookup
-    title_to_field: dict[str, str] = {v: k for k, v in field_to_title.items()}
-
-    # Parse rows into use_case dicts
-    use_cases: list[dict[str, Any]] = []
-    for idx, row in enumerate(sheet.get("rows", []), start=1):
-        record: dict[str, Any] = {"id": idx}
-        for cell in row.get("cells", []):
-            col_title = col_id_to_title.get(cell.get("columnId", 0), "")
-            field = title_to_field.get(col_title)
-            if field:
-                record[field] = cell.get("displayValue") or cell.get("value") or ""
-        # Only include rows that have at least a name
-        if record.get("name"):
-            use_cases.append(record)
-
-    # Compute summary counts from the rows (KPI aggregation is done client-side)
-    statuses = [uc.get("status", "") for uc in use_cases]
+
+def _request_headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+    }
+
+
+def fetch_smartsheet_data() -> dict[str, Any]:
+    """
+    Call the Smartsheet API and return data in the same shape as use_cases.json.
+
+    Requires SMARTSHEET_API_TOKEN env var and a valid sheet_id in
+    data/smartsheet_config.json.
+    """
+    token = _require_token()
+
+    # Fetch the sheet (columns + rows in one call)
+    url = _SHEET_URL
+    headers = _request_headers(token)
+    if _HTTP is not None:
+        resp = _HTTP.request("GET", url, headers=headers)
+        if resp.status >= 400:
+            # Match the urllib path so _handle_api's 502 mapping still applies
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, None, None)
+        raw = resp.data
+    else:
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=15) as fallback_resp:
+            raw = fallback_resp.read()
+    # orjson/ujson parse bytes directly — skip the .decode() pass
+    return _build_payload(_json_fast.loads(raw))
+
+
+async def fetch_smartsheet_data_async(session: "aiohttp.ClientSession") -> dict[str, Any]:
+    """Async variant of fetch_smartsheet_data using a shared aiohttp session.
+
+    The event loop is released during the Smartsheet round-trip, so other
+    requests (static files, concurrent API hits) keep being served.
+    """
+    token = _require_token()
+    url = _SHEET_URL
+    async with session.get(url, headers=_request_headers(token)) as resp:
+        if resp.status >= 400:
+            # Match the sync path so the 502 mapping applies in both modes
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, None, None)
+        raw = await resp.read()
+    return _build_payload(_json_fast.loads(raw))
+
+
+def _row_to_record(idx: int, row: dict[str, Any], col_get: Any) -> dict[str, Any]:
+    """Turn one Smartsheet row into a use_case record (may lack a name)."""
+    record: dict[str, Any] = {"id": idx}
+    for cell in row.get("cells", _EMPTY):
+        field = col_get(cell.get("columnId"))
+        if field is not None:
+            record[field] = cell.get("displayValue") or cell.get("value") or ""
+    return record
+
+
+# Below this row count the thread-pool setup costs more than it saves
+_PARALLEL_ROW_THRESHOLD = 500
+
+
+def _parse_rows(rows: Any, col_id_to_field: dict[int, str]) -> list[dict[str, Any]]:
+    """Parse rows into named use_case records, fanning out on large sheets.
+
+    Rows without a name are dropped but keep their slot in the id numbering,
+    so ids are identical whichever implementation runs.
+    """
+    if _parse_rows_c is not None:
+        # The compiled loop beats both the comprehension and the thread pool
+        return _parse_rows_c(list(rows), col_id_to_field)
+
+    col_get = col_id_to_field.get
+
+    def parse_slice(start: int, chunk: Any) -> list[dict[str, Any]]:
+        # The comprehension collects accepted records via the dedicated
+        # LIST_APPEND opcode, skipping bound-method dispatch per row.
+        return [
+            record
+            for idx, row in enumerate(chunk, start=start + 1)
+            if (record := _row_to_record(idx, row, col_get)).get("name")
+        ]
+
+    if len(rows) < _PARALLEL_ROW_THRESHOLD:
+        return parse_slice(0, rows)
+
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(rows) // workers)  # ceil division
+    starts = range(0, len(rows), chunk_size)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(parse_slice, starts, (rows[s:s + chunk_size] for s in starts))
+    return [record for sub in results for record in sub]
+
+
+def _build_payload(sheet: dict[str, Any]) -> dict[str, Any]:
+    """Transform a decoded Smartsheet sheet into the use_cases.json shape."""
+    # Build column-id → json_field lookup (one dict hop per cell instead of two)
+    col_id_to_field: dict[int, str] = {
+        col["id"]: _TITLE_TO_FIELD[col["title"]]
+        for col in sheet.get("columns", _EMPTY)
+        if col["title"] in _TITLE_TO_FIELD
+    }
+
+    use_cases = _parse_rows(sheet.get("rows", _EMPTY), col_id_to_field)
+    status_counts = Counter(uc.get("status", "") for uc in use_cases)
+
+    # Summary counts for the KPI strip (aggregation beyond this is client-side)
     summary = {
         "total_initiatives": len(use_cases),
-        "in_production": statuses.count("In Production"),
-        "poc_done": statuses.count("POC Done"),
-        "poc_in_progress": statuses.count("POC In Progress"),
+        "in_production": status_counts["In Production"],
+        "poc_done": status_counts["POC Done"],
+        "poc_in_progress": status_counts["POC In Progress"],
     }
 
     return {
-        "metadata": {
-            "title": sheet.get("name", "AI Use Cases"),
-            "source": "Smartsheet (live)",
-            "last_updated": "live",
-        },
+        "metadata": {"title": sheet.get("name", "AI Use Cases"), **_METADATA_BASE},
         "summary": summary,
         "use_cases": use_cases,
     }
 
 
+# Short in-process cache of the encoded body: rapid repeat hits skip the
+# Smartsheet fetch, the row parsing, and the encode entirely.
+_CACHE_TTL = 60.0
+_cache_lock = threading.Lock()
+_cached_body: "tuple[float, bytes] | None" = None
+
+
+def _get_body() -> bytes:
+    """Return the encoded /api/use-cases body, refreshing it when stale."""
+    global _cached_body
+    with _cache_lock:
+        if _cached_body is not None and time.monotonic() - _cached_body[0] < _CACHE_TTL:
+            return _cached_body[1]
+        # Fetch while holding the lock so concurrent callers don't stampede
+        body = _dumps(fetch_smartsheet_data())
+        _cached_body = (time.monotonic(), body)
+        return body
+
+
+async def _get_body_async(session: "aiohttp.ClientSession") -> bytes:
+    """Async counterpart of _get_body (single-threaded loop, no lock needed)."""
+    global _cached_body
+    cached = _cached_body
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+        return cached[1]
+    body = _dumps(await fetch_smartsheet_data_async(session))
+    _cached_body = (time.monotonic(), body)
+    return body
+
+
 class AppHandler(SimpleHTTPRequestHandler):
     """Extends the static file server with an API route."""
 
@@ -146,8 +325,7 @@ class AppHandler(SimpleHTTPRequestHandler):
     def _handle_api(self) -> None:
         """Serve Smartsheet data as JSON."""
         try:
-            payload = fetch_smartsheet_data()
-            body = json.dumps(payload, indent=2).encode("utf-8")
+            body = _get_body()
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(body)))
@@ -165,7 +343,7 @@ class AppHandler(SimpleHTTPRequestHandler):
             self._send_error(500, f"Internal error: {exc}")
 
     def _send_error(self, code: int, message: str) -> None:
-        body = json.dumps({"error": message}).encode("utf-8")
+        body = _dumps({"error": message})
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -177,9 +355,72 @@ class AppHandler(SimpleHTTPRequestHandler):
         print(f"[server] {args[0]} {args[1]}")
 
 
+# --- aiohttp mode (used automatically when aiohttp is installed) ----------
+
+
+def _json_response(payload_bytes: bytes, status: int = 200) -> "web.Response":
+    return web.Response(
+        body=payload_bytes,
+        status=status,
+        content_type="application/json",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _handle_api_async(request: "web.Request") -> "web.Response":
+    """Async equivalent of AppHandler._handle_api."""
+    try:
+        return _json_response(await _get_body_async(request.app["session"]))
+    except RuntimeError as exc:
+        return _json_response(_dumps({"error": str(exc)}), status=503)
+    except urllib.error.HTTPError as exc:
+        message = f"Smartsheet API returned {exc.code}: {exc.reason}"
+        return _json_response(_dumps({"error": message}), status=502)
+    except Exception as exc:
+        return _json_response(_dumps({"error": f"Internal error: {exc}"}), status=500)
+
+
+async def _handle_index(request: "web.Request") -> "web.FileResponse":
+    return web.FileResponse(Path(__file__).parent / "index.html")
+
+
+def run_async_server() -> None:
+    """Serve via aiohttp: one process, many concurrent clients."""
+
+    async def on_startup(app: "web.Application") -> None:
+        app["session"] = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+
+    async def on_cleanup(app: "web.Application") -> None:
+        await app["session"].close()
+
+    app = web.Application()
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    app.router.add_get("/api/use-cases", _handle_api_async)
+    app.router.add_get("/", _handle_index)
+    app.router.add_static("/", Path(__file__).parent)
+    web.run_app(app, port=PORT, print=None)
+
+
+def run_stdlib_server() -> None:
+    """Serve via the stdlib HTTP server (no third-party dependencies).
+
+    ThreadingHTTPServer handles each request on its own thread, so static
+    assets keep loading while /api/use-cases waits on Smartsheet; the lock
+    in _get_body keeps the shared cache safe across those threads.
+    """
+    server = ThreadingHTTPServer(("", PORT), AppHandler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[server] Stopped.")
+        server.server_close()
+
+
 if __name__ == "__main__":
     load_dotenv()
-    server = HTTPServer(("", PORT), AppHandler)
     print(f"[server] Serving on http://localhost:{PORT}")
     print(f"[server] Dashboard: http://localhost:{PORT}")
     if os.environ.get("SMARTSHEET_API_TOKEN"):
@@ -187,8 +428,7 @@ if __name__ == "__main__":
     else:
         print("[server] No SMARTSHEET_API_TOKEN set — /api/use-cases will return 503")
     print("[server] Press Ctrl+C to stop\n")
-    try:
-        server.serve_forever()
-    except KeyboardInterrupt:
-        print("\n[server] Stopped.")
-        server.server_close()
+    if aiohttp is not None:
+        run_async_server()
+    else:
+        run_stdlib_server()